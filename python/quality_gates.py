@@ -17,16 +17,29 @@ Example usage:
         sys.exit(1)
 """
 
+import copy
+import fnmatch
+import functools
+import os
+import re
 import subprocess
+import sys
 import time
-from dataclasses import dataclass, field
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields, replace
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import yaml
 
+# libyaml-backed loader is several times faster than the pure-Python one;
+# PyYAML built without libyaml falls back to SafeLoader
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class GateConfig:
     """Configuration for a single quality gate.
 
@@ -42,26 +55,46 @@ class GateConfig:
     threshold: int | None = None
     description: str = ""
     required: bool = True
-    depends_on: list[str] = field(default_factory=list)
-    omit_patterns: list[str] = field(default_factory=list)
-    skip_if_only_paths: list[str] = field(default_factory=list)
+    depends_on: tuple[str, ...] = field(default_factory=tuple)
+    omit_patterns: tuple[str, ...] = field(default_factory=tuple)
+    skip_if_only_paths: tuple[str, ...] = field(default_factory=tuple)
     fail_message: str = ""
     timeout_seconds: int = 300
     stage_relaxations: dict[str, dict[str, Any]] = field(default_factory=dict)
+    # Matcher for skip_if_only_paths, derived in __post_init__
+    skip_matcher: "_SkipMatcher | None" = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Accept any iterable of strings but store immutable tuples
+        for name in ("depends_on", "omit_patterns", "skip_if_only_paths"):
+            value = getattr(self, name)
+            if type(value) is not tuple:
+                object.__setattr__(self, name, tuple(value))
+        object.__setattr__(self, "skip_matcher", _compile_skip_paths(self.skip_if_only_paths))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QualityGatesConfig:
-    """Complete quality gate configuration."""
+    """Complete quality gate configuration.
+
+    Loaded configs are shared between callers, so containers are stored as
+    read-only views: gates and emergency_bypass as MappingProxyType and
+    execution_order as a tuple.
+    """
 
     version: str
-    gates: dict[str, GateConfig]
-    execution_order: list[str]
-    emergency_bypass: dict[str, Any]
+    gates: Mapping[str, GateConfig]
+    execution_order: tuple[str, ...]
+    emergency_bypass: Mapping[str, Any]
     override_file: str | None = None
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "gates", MappingProxyType(dict(self.gates)))
+        object.__setattr__(self, "execution_order", tuple(self.execution_order))
+        object.__setattr__(self, "emergency_bypass", MappingProxyType(dict(self.emergency_bypass)))
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class GateResult:
     """Result of executing a single gate."""
 
@@ -72,27 +105,43 @@ class GateResult:
     fail_message: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExecutionResults:
     """Results of executing all gates."""
 
     passed: bool
-    failed_count: int
     total_count: int
     duration_seconds: float
     results: list[GateResult]
-    failures: list[GateResult]
+
+    @property
+    def failures(self) -> tuple[GateResult, ...]:
+        """Results of the gates that failed, in execution order."""
+        return tuple(r for r in self.results if not r.passed)
+
+    @property
+    def failed_count(self) -> int:
+        """Number of gates that failed."""
+        return sum(not r.passed for r in self.results)
 
 
 def load_config(
     base_config: Path | str | None = None,
     override_config: Path | str | None = None,
+    base_data: dict | None = None,
 ) -> QualityGatesConfig:
     """Load quality gate configuration with optional overrides.
 
+    Results are memoized per (base, override) file pair and invalidated when
+    either file's mtime or size changes, so repeated loads in one process skip
+    YAML parsing. The returned config may be shared between calls; treat it
+    as read-only.
+
     Args:
         base_config: Path to base configuration file (defaults to org-standards/config/quality-gates.yaml)
         override_config: Path to override configuration file (defaults to quality-gates.local.yaml)
+        base_data: Already-parsed base configuration; when given, base_config
+            is ignored and the result is not memoized
 
     Returns:
         Parsed and merged quality gates configuration
@@ -101,29 +150,101 @@ def load_config(
         FileNotFoundError: If base config not found
         ValueError: If config is invalid or inconsistent
     """
+    if base_data is not None:
+        if override_config is None:
+            override_config = base_data.get("override_file", "quality-gates.local.yaml")
+        override_path = os.path.abspath(override_config)
+        return _build_config_from(base_data, override_path, _file_stamp(override_path))
+
     if base_config is None:
         base_config = Path("org-standards/config/quality-gates.yaml")
-    elif isinstance(base_config, str):
-        base_config = Path(base_config)
 
-    if not base_config.exists():
+    base_path = os.path.abspath(base_config)
+    base_stamp = _file_stamp(base_path)
+    if base_stamp is None:
         raise FileNotFoundError(f"Config not found: {base_config}")
 
-    # Load base config
-    with open(base_config) as f:
-        base = yaml.safe_load(f)
-
-    # Load overrides if exist
+    # Default override location comes from the base config itself
     if override_config is None:
-        override_file = base.get("override_file", "quality-gates.local.yaml")
-        override_config = Path(override_file)
-    elif isinstance(override_config, str):
-        override_config = Path(override_config)
+        # Peek at the cached parse: only one key is needed, so skip the deep copy
+        base = _read_yaml_cached(base_path, base_stamp)
+        override_config = base.get("override_file", "quality-gates.local.yaml")
+
+    override_path = os.path.abspath(override_config)
+
+    return _load_config_cached(base_path, base_stamp, override_path, _file_stamp(override_path))
+
+
+def _file_stamp(path: str) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) for path, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+# Parsed YAML keyed by absolute path -> ((mtime_ns, size), data), oldest evicted first
+_YAML_CACHE: "OrderedDict[str, tuple[tuple[int, int] | None, dict[str, Any]]]" = OrderedDict()
+_YAML_CACHE_MAX = 100
+
+
+def _load_yaml_cached(path: str, stamp: tuple[int, int] | None = None) -> dict[str, Any]:
+    """Parse a YAML file, reusing the previous parse while its stamp is unchanged.
+
+    Args:
+        path: Absolute path to the YAML file
+        stamp: (mtime_ns, size) of the file if the caller already has it
+
+    Returns:
+        Deep copy of the parsed document (safe for the caller to mutate)
+    """
+    return copy.deepcopy(_read_yaml_cached(path, stamp))
 
+
+def _read_yaml_cached(path: str, stamp: tuple[int, int] | None = None) -> dict[str, Any]:
+    """Like _load_yaml_cached, but return the cached document itself (read-only)."""
+    if stamp is None:
+        stamp = _file_stamp(path)
+
+    cached = _YAML_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        _YAML_CACHE.move_to_end(path)
+        return cached[1]
+
+    data: dict[str, Any] = yaml.load(Path(path).read_bytes(), Loader=_YamlLoader) or {}
+
+    _YAML_CACHE[path] = (stamp, data)
+    _YAML_CACHE.move_to_end(path)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+        _YAML_CACHE.popitem(last=False)
+
+    return data
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(
+    base_path: str,
+    base_stamp: tuple[int, int],
+    override_path: str,
+    override_stamp: tuple[int, int] | None,
+) -> QualityGatesConfig:
+    """Merge, validate and parse a base/override pair (memoized by file stamps)."""
+    return _build_config_from(
+        _load_yaml_cached(base_path, base_stamp), override_path, override_stamp
+    )
+
+
+def _build_config_from(
+    base: dict[str, Any],
+    override_path: str,
+    override_stamp: tuple[int, int] | None,
+) -> QualityGatesConfig:
+    """Merge the override file (if it exists) into base, then validate and parse."""
+    # Load overrides if exist
     overrides: dict[str, Any] = {}
-    if override_config.exists():
-        with open(override_config) as f:
-            overrides = yaml.safe_load(f) or {}
+    if override_stamp is not None:
+        overrides = _load_yaml_cached(override_path, override_stamp)
 
     # Merge configs
     config = _merge_configs(base, overrides)
@@ -163,9 +284,12 @@ def execute_gates(config: QualityGatesConfig, phase: str = "pre-push") -> Execut
     # Apply stage relaxations
     config = _apply_stage_relaxations(config, stage)
 
+    # Modified files are computed at most once per run, shared by all gates
+    _reset_modified_files_cache()
+
     start_time = time.time()
     results = []
-    failures = []
+    passed = True
 
     for gate_name in config.execution_order:
         gate = config.gates[gate_name]
@@ -184,7 +308,7 @@ def execute_gates(config: QualityGatesConfig, phase: str = "pre-push") -> Execut
         results.append(result)
 
         if not result.passed:
-            failures.append(result)
+            passed = False
             if gate.required:
                 print(f"❌ {gate_name} failed (required gate)")
                 break
@@ -196,21 +320,35 @@ def execute_gates(config: QualityGatesConfig, phase: str = "pre-push") -> Execut
     total_duration = time.time() - start_time
 
     return ExecutionResults(
-        passed=len(failures) == 0,
-        failed_count=len(failures),
+        passed=passed,
         total_count=len(results),
         duration_seconds=total_duration,
         results=results,
-        failures=failures,
     )
 
 
+# Modified files for the current gate run (None = not computed yet)
+_MODIFIED_FILES_CACHE: list[str] | None = None
+
+
+def _reset_modified_files_cache() -> None:
+    """Forget cached modified files (called at the start of each gate run)."""
+    global _MODIFIED_FILES_CACHE
+    _MODIFIED_FILES_CACHE = None
+
+
 def _get_modified_files() -> list[str]:
     """Get list of files modified compared to main branch.
 
+    Runs git once per gate run; later calls get a copy of the cached list.
+
     Returns:
         List of modified file paths (relative to repo root)
     """
+    global _MODIFIED_FILES_CACHE
+    if _MODIFIED_FILES_CACHE is not None:
+        return list(_MODIFIED_FILES_CACHE)
+
     try:
         result = subprocess.run(
             ["git", "diff", "--name-only", "origin/main...HEAD"],
@@ -219,10 +357,64 @@ def _get_modified_files() -> list[str]:
             check=True,
         )
         files = [f.strip() for f in result.stdout.split("\n") if f.strip()]
-        return files
     except subprocess.CalledProcessError:
         # If git command fails (e.g., not in a git repo), return empty list
-        return []
+        files = []
+
+    _MODIFIED_FILES_CACHE = files
+    return list(files)
+
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+class _SkipMatcher:
+    """Matches a path against a gate's skip_if_only_paths globs.
+
+    Literal paths are set lookups and "dir/**" globs are prefix tests; only
+    the remaining globs go through one combined regex.
+    """
+
+    __slots__ = ("exact", "prefixes", "regex")
+
+    def __init__(self, patterns: tuple[str, ...]) -> None:
+        exact = set()
+        prefixes = []
+        globs = []
+        for pattern in patterns:
+            if _GLOB_CHARS.isdisjoint(pattern):
+                exact.add(pattern)
+            elif pattern.endswith("/**") and _GLOB_CHARS.isdisjoint(pattern[:-3]):
+                prefixes.append(pattern[:-2])  # keep the trailing "/"
+            else:
+                globs.append(pattern)
+        self.exact = frozenset(exact)
+        self.prefixes = tuple(prefixes)
+        self.regex = (
+            re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in globs)) if globs else None
+        )
+
+    def match(self, path: str) -> bool:
+        return (
+            path in self.exact
+            or path.startswith(self.prefixes)
+            or (self.regex is not None and self.regex.match(path) is not None)
+        )
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_skip_paths(patterns: tuple[str, ...]) -> _SkipMatcher | None:
+    """Build the skip matcher for a gate (None if there are no patterns).
+
+    Args:
+        patterns: Glob patterns from skip_if_only_paths
+
+    Returns:
+        Matcher whose match(path) is True when any pattern matches the path
+    """
+    if not patterns:
+        return None
+    return _SkipMatcher(patterns)
 
 
 def _matches_pattern(file_path: str, pattern: str) -> bool:
@@ -235,9 +427,8 @@ def _matches_pattern(file_path: str, pattern: str) -> bool:
     Returns:
         True if file matches pattern, False otherwise
     """
-    import fnmatch
-
-    return fnmatch.fnmatch(file_path, pattern)
+    matcher = _compile_skip_paths((pattern,))
+    return matcher is not None and matcher.match(file_path)
 
 
 def _should_skip_gate(gate: GateConfig) -> bool:
@@ -254,7 +445,8 @@ def _should_skip_gate(gate: GateConfig) -> bool:
     Returns:
         True if gate should be skipped, False otherwise
     """
-    if not gate.skip_if_only_paths:
+    skip_matcher = gate.skip_matcher
+    if skip_matcher is None:
         return False
 
     modified_files = _get_modified_files()
@@ -263,17 +455,8 @@ def _should_skip_gate(gate: GateConfig) -> bool:
     if not modified_files:
         return False
 
-    # Check if all files match at least one skip pattern
-    for file_path in modified_files:
-        matches_any = any(
-            _matches_pattern(file_path, pattern) for pattern in gate.skip_if_only_paths
-        )
-        if not matches_any:
-            # Found a file that doesn't match any skip pattern
-            return False
-
-    # All files matched skip patterns
-    return True
+    # All files must match a skip pattern; stops at the first file that doesn't
+    return all(skip_matcher.match(file_path) for file_path in modified_files)
 
 
 def _execute_gate(gate: GateConfig) -> GateResult:
@@ -354,8 +537,16 @@ def _execute_gate(gate: GateConfig) -> GateResult:
         )
 
 
+# Top-level keys an override file replaces wholesale (gates merge per gate)
+_OVERRIDABLE_KEYS = ("version", "execution_order", "emergency_bypass")
+
+
 def _merge_configs(base: dict, overrides: dict) -> dict:
-    """Deep merge override config into base config.
+    """Merge override config into base config.
+
+    Only version, execution_order and emergency_bypass are replaced; gates
+    merge per gate (each overridden gate's keys win). Other override keys are
+    ignored. Base is never mutated.
 
     Args:
         base: Base configuration dictionary
@@ -364,22 +555,20 @@ def _merge_configs(base: dict, overrides: dict) -> dict:
     Returns:
         Merged configuration
     """
-    result = base.copy()
+    result = base | {key: overrides[key] for key in _OVERRIDABLE_KEYS if key in overrides}
 
     if "gates" in overrides:
+        gates = dict(base.get("gates", {}))
         for gate_name, gate_overrides in overrides["gates"].items():
-            if gate_name in result["gates"]:
-                result["gates"][gate_name].update(gate_overrides)
-            else:
-                result["gates"][gate_name] = gate_overrides
-
-    for key in ["version", "execution_order", "emergency_bypass"]:
-        if key in overrides:
-            result[key] = overrides[key]
+            gates[gate_name] = gates.get(gate_name, {}) | gate_overrides
+        result["gates"] = gates
 
     return result
 
 
+_REQUIRED_FIELDS = frozenset({"version", "gates", "execution_order"})
+
+
 def _validate_config(config: dict) -> None:
     """Validate config structure and consistency.
 
@@ -389,18 +578,67 @@ def _validate_config(config: dict) -> None:
     Raises:
         ValueError: If configuration is invalid
     """
-    required = ["version", "gates", "execution_order"]
-    missing = [k for k in required if k not in config]
+    missing = sorted(_REQUIRED_FIELDS - config.keys())
     if missing:
         raise ValueError(f"Missing required fields: {missing}")
 
     # Check execution_order references valid gates
-    gate_names = set(config["gates"].keys())
-    order = config["execution_order"]
-    invalid = [g for g in order if g not in gate_names]
+    invalid = sorted(set(config["execution_order"]).difference(config["gates"]))
     if invalid:
         raise ValueError(f"execution_order references undefined gates: {invalid}")
 
+    _check_dependency_cycles(config["gates"])
+
+
+def _check_dependency_cycles(gates: dict) -> None:
+    """Reject gate dependency cycles using Kahn's topological sort.
+
+    Dependencies on gates that are not defined are ignored here.
+
+    Args:
+        gates: Raw gate definitions keyed by gate name
+
+    Raises:
+        ValueError: If depends_on forms a cycle
+    """
+    indegree = dict.fromkeys(gates, 0)
+    dependents: dict[str, list[str]] = {name: [] for name in gates}
+    for name, gate in gates.items():
+        for dep in gate.get("depends_on") or ():
+            if dep in indegree:
+                indegree[name] += 1
+                dependents[dep].append(name)
+
+    ready = deque(name for name, degree in indegree.items() if degree == 0)
+    processed = 0
+    while ready:
+        processed += 1
+        for name in dependents[ready.popleft()]:
+            indegree[name] -= 1
+            if indegree[name] == 0:
+                ready.append(name)
+
+    if processed < len(gates):
+        # Unprocessed gates are on a cycle or only blocked by one; name the former
+        remaining = {name for name, degree in indegree.items() if degree}
+        cyclic = sorted(name for name in remaining if _reaches(name, name, dependents, remaining))
+        raise ValueError(f"Circular dependency in gates: {cyclic}")
+
+
+def _reaches(start: str, target: str, edges: dict[str, list[str]], nodes: set[str]) -> bool:
+    """Return True if target is reachable from start in one or more steps within nodes."""
+    stack = list(edges[start])
+    seen: set[str] = set()
+    while stack:
+        name = stack.pop()
+        if name == target:
+            return True
+        if name in seen or name not in nodes:
+            continue
+        seen.add(name)
+        stack.extend(edges[name])
+    return False
+
 
 def _parse_config(config: dict) -> QualityGatesConfig:
     """Parse raw config dict into typed dataclasses.
@@ -422,9 +660,9 @@ def _parse_config(config: dict) -> QualityGatesConfig:
             threshold=gate_dict.get("threshold"),
             description=gate_dict.get("description", ""),
             required=gate_dict["required"],
-            depends_on=gate_dict.get("depends_on", []),
-            omit_patterns=gate_dict.get("omit_patterns", []),
-            skip_if_only_paths=gate_dict.get("skip_if_only_paths", []),
+            depends_on=tuple(gate_dict.get("depends_on", ())),
+            omit_patterns=tuple(gate_dict.get("omit_patterns", ())),
+            skip_if_only_paths=tuple(gate_dict.get("skip_if_only_paths", ())),
             fail_message=gate_dict.get("fail_message", ""),
             timeout_seconds=gate_dict.get("timeout_seconds", 300),
         )
@@ -448,8 +686,6 @@ def _detect_stage() -> str | None:
     Returns:
         Stage name ("pre-push", "pr", "push-to-main") or None if cannot detect
     """
-    import os
-
     # GitHub Actions detection
     if os.getenv("GITHUB_ACTIONS") == "true":
         event_name = os.getenv("GITHUB_EVENT_NAME")
@@ -491,24 +727,86 @@ def _apply_stage_relaxations(
             f"Check for typos (e.g., 'pre_push' should be 'pre-push')."
         )
 
-    # Deep copy config to avoid modifying original
-    import copy
+    # Configs are frozen: build relaxed copies of affected gates, share the rest
+    gate_fields = {f.name for f in fields(GateConfig) if f.init}
+    gates = {}
+    for gate_name, gate in config.gates.items():
+        relaxations = gate.stage_relaxations.get(stage)
+        if not relaxations:
+            gates[gate_name] = gate
+            continue
 
-    config = copy.deepcopy(config)
+        # Apply each relaxation
+        changes = {}
+        for key, value in relaxations.items():
+            if key in gate_fields:
+                changes[key] = value
+            else:
+                # Log warning for unknown keys
+                print(f"⚠️  Unknown relaxation key '{key}' for gate '{gate_name}' stage '{stage}'")
+        gates[gate_name] = replace(gate, **changes)
 
-    # Apply relaxations for each gate
-    for gate_name, gate in config.gates.items():
-        if stage in gate.stage_relaxations:
-            relaxations = gate.stage_relaxations[stage]
-
-            # Apply each relaxation
-            for key, value in relaxations.items():
-                if hasattr(gate, key):
-                    setattr(gate, key, value)
-                else:
-                    # Log warning for unknown keys
-                    print(
-                        f"⚠️  Unknown relaxation key '{key}' for gate '{gate_name}' stage '{stage}'"
-                    )
-
-    return config
+    return replace(config, gates=gates)
+
+
+def main(base_config: Path | str | None = None) -> int:
+    """Run pre-push quality gates and print a summary (entry point for the git hook).
+
+    Args:
+        base_config: Path to base configuration file (see load_config)
+
+    Returns:
+        Exit code: 0 if all gates passed, 1 otherwise
+    """
+    try:
+        # Load configuration
+        config = load_config(base_config)
+
+        print(f"Configuration loaded: version {config.version}")
+        print(
+            f"Gates to execute: {len([g for g in config.gates.values() if g.enabled])}/{len(config.gates)}"
+        )
+        print("")
+
+        # Execute gates
+        results = execute_gates(config, phase="pre-push")
+    except FileNotFoundError as e:
+        print("❌ ERROR: Configuration file not found", file=sys.stderr)
+        print(f"   {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print("❌ ERROR: Quality gate execution failed", file=sys.stderr)
+        print(f"   {e}", file=sys.stderr)
+        return 1
+
+    # Print summary
+    print("")
+    print("=" * 70)
+    print(f"Results: {results.total_count} gates executed in {results.duration_seconds:.1f}s")
+    print(f"  ✅ Passed: {results.total_count - results.failed_count}")
+    print(f"  ❌ Failed: {results.failed_count}")
+    print("=" * 70)
+
+    if results.passed:
+        print("")
+        print("✅ All quality gates passed - push allowed")
+        print("")
+        return 0
+
+    print("")
+    print("❌ Quality gates failed - push blocked")
+    print("")
+    print("Failed gates:")
+    for failure in results.failures:
+        print(f"  - {failure.gate_name}: {failure.message[:100]}")
+        if failure.fail_message:
+            print(f"    Fix: {failure.fail_message}")
+    print("")
+    print("Emergency bypass (use with caution):")
+    print("  EMERGENCY_PUSH=1 EMERGENCY_REASON='reason' git push")
+    print("")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
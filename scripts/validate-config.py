@@ -23,12 +23,14 @@ except ImportError as e:
     print("Install with: pip install pyyaml jsonschema")
     sys.exit(1)
 
+# libyaml-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_yaml(path: Path) -> dict[str, Any]:
     """Load YAML file."""
     try:
-        with open(path) as f:
-            return yaml.safe_load(f)
+        return yaml.load(path.read_bytes(), Loader=_YamlLoader)
     except yaml.YAMLError as e:
         print(f"❌ YAML syntax error in {path}:")
         print(f"   {e}")
@@ -41,8 +43,7 @@ def load_yaml(path: Path) -> dict[str, Any]:
 def validate_schema(config: dict[str, Any], schema_path: Path) -> bool:
     """Validate config against JSON Schema."""
     try:
-        with open(schema_path) as f:
-            schema = json.load(f)
+        schema = json.loads(schema_path.read_bytes())
     except FileNotFoundError:
         print(f"❌ Schema file not found: {schema_path}")
         return False
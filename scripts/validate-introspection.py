@@ -32,6 +32,30 @@ REQUIRED_SECTIONS = [
     "## How to Avoid Next Time",
 ]
 
+# Minimum non-whitespace document length (avoid empty sections)
+MIN_CONTENT_LENGTH = 200
+
+
+def _stripped_length(content: str) -> int:
+    """
+    Length of content without leading/trailing whitespace.
+
+    Scans inward from both ends instead of calling str.strip(), so no copy
+    of the document is made just to measure it.
+
+    Args:
+        content: Document text
+
+    Returns:
+        Equivalent of len(content.strip())
+    """
+    start, end = 0, len(content)
+    while start < end and content[start].isspace():
+        start += 1
+    while end > start and content[end - 1].isspace():
+        end -= 1
+    return end - start
+
 
 def validate_introspection(file_path: str) -> tuple[bool, str]:
     """
@@ -69,7 +93,7 @@ def validate_introspection(file_path: str) -> tuple[bool, str]:
         return False, "Missing required sections:\n  - " + "\n  - ".join(missing_sections)
 
     # Check minimum content length (avoid empty sections)
-    if len(content.strip()) < 200:
+    if _stripped_length(content) < MIN_CONTENT_LENGTH:
         return (
             False,
             f"Document too short ({len(content)} chars). Introspection should provide meaningful analysis.",
@@ -15,6 +15,7 @@ Exit codes:
 """
 
 import json
+import os
 import sys
 from pathlib import Path
 from typing import Any
@@ -129,14 +130,14 @@ class MCPConfigValidator:
         # Check for absolute paths (workspace root should be absolute)
         if len(args) >= 3:
             workspace_path = args[-1]  # Assume last arg is workspace path
-            if not workspace_path.startswith("/"):
+            if not os.path.isabs(workspace_path):
                 self.warnings.append(
                     f"Server '{server_name}': Workspace path '{workspace_path}' "
                     f"is not absolute. Use full path for reliability."
                 )
             else:
                 # Validate path exists
-                if not Path(workspace_path).exists():
+                if not os.path.exists(workspace_path):
                     self.errors.append(f"Server '{server_name}': Workspace path '{workspace_path}' does not exist")
 
     def _is_valid_module_name(self, name: str) -> bool:
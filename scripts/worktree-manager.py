@@ -39,6 +39,13 @@ class Color:
     NC = "\033[0m"  # No Color
 
 
+# Prebuilt (prefix, suffix) pairs so message helpers only concatenate the message
+_ERROR = (f"{Color.RED}Error: ", Color.NC)
+_SUCCESS = (Color.GREEN, Color.NC)
+_INFO = (Color.BLUE, Color.NC)
+_WARNING = (Color.YELLOW, Color.NC)
+
+
 class WorktreeManager:
     """Manages git worktrees for NeerajDev repositories.
 
@@ -67,19 +74,23 @@ class WorktreeManager:
 
     def _error(self, message: str) -> None:
         """Print error message."""
-        print(f"{Color.RED}Error: {message}{Color.NC}", file=sys.stderr)
+        prefix, suffix = _ERROR
+        print(prefix + message + suffix, file=sys.stderr)
 
     def _success(self, message: str) -> None:
         """Print success message."""
-        print(f"{Color.GREEN}{message}{Color.NC}")
+        prefix, suffix = _SUCCESS
+        print(prefix + message + suffix)
 
     def _info(self, message: str) -> None:
         """Print info message."""
-        print(f"{Color.BLUE}{message}{Color.NC}")
+        prefix, suffix = _INFO
+        print(prefix + message + suffix)
 
     def _warning(self, message: str) -> None:
         """Print warning message."""
-        print(f"{Color.YELLOW}{message}{Color.NC}")
+        prefix, suffix = _WARNING
+        print(prefix + message + suffix)
 
     def _run_git(self, repo_path: Path, args: list[str]) -> subprocess.CompletedProcess:
         """
@@ -90,11 +101,10 @@ class WorktreeManager:
             args: Git command arguments
 
         Returns:
-            CompletedProcess result
+            CompletedProcess result with undecoded stdout/stderr bytes
+            (callers decode only the stream they consume)
         """
-        return subprocess.run(
-            ["git"] + args, cwd=repo_path, capture_output=True, text=True
-        )
+        return subprocess.run(["git"] + args, cwd=repo_path, capture_output=True)
 
     def _normalize_repo_name(self, repo: str) -> str:
         """
@@ -158,7 +168,8 @@ class WorktreeManager:
                 continue
 
             self._success(f"{repo}:")
-            for line in result.stdout.strip().split("\n"):
+            stdout = result.stdout.decode("utf-8", errors="replace")
+            for line in stdout.strip().split("\n"):
                 if not line:
                     continue
 
@@ -202,7 +213,8 @@ class WorktreeManager:
         result = self._run_git(repo_path, ["worktree", "add", str(worktree_path), branch])
 
         if result.returncode != 0:
-            self._error(f"Failed to create worktree:\n{result.stderr}")
+            stderr = result.stderr.decode("utf-8", errors="replace")
+            self._error(f"Failed to create worktree:\n{stderr}")
             sys.exit(1)
 
         self._success("✓ Worktree created successfully!")
@@ -227,7 +239,7 @@ class WorktreeManager:
                 continue
 
             result = self._run_git(repo_path, ["worktree", "list"])
-            if result.returncode == 0 and str(wt_path) in result.stdout:
+            if result.returncode == 0 and str(wt_path) in result.stdout.decode("utf-8", errors="replace"):
                 self._info(f"Removing worktree: {wt_path}")
                 remove_result = self._run_git(
                     repo_path, ["worktree", "remove", str(wt_path)]
@@ -237,7 +249,8 @@ class WorktreeManager:
                     self._success("✓ Removed")
                     return
                 else:
-                    self._error(f"Failed to remove:\n{remove_result.stderr}")
+                    stderr = remove_result.stderr.decode("utf-8", errors="replace")
+                    self._error(f"Failed to remove:\n{stderr}")
                     sys.exit(1)
 
         self._error(f"Worktree not found: {wt_path}")
@@ -308,22 +321,27 @@ Examples:
     # list command
     list_parser = subparsers.add_parser("list", help="List worktrees")
     list_parser.add_argument("repo", nargs="?", help="Filter by repository")
+    list_parser.set_defaults(func=lambda m, a: m.list_worktrees(a.repo))
 
     # create command
     create_parser = subparsers.add_parser("create", help="Create new worktree")
     create_parser.add_argument("repo", help="Repository name")
     create_parser.add_argument("branch", help="Branch name")
+    create_parser.set_defaults(func=lambda m, a: m.create_worktree(a.repo, a.branch))
 
     # remove command
     remove_parser = subparsers.add_parser("remove", help="Remove worktree")
     remove_parser.add_argument("path", help="Path to worktree")
+    remove_parser.set_defaults(func=lambda m, a: m.remove_worktree(a.path))
 
     # goto command
     goto_parser = subparsers.add_parser("goto", help="Show cd commands for worktree")
     goto_parser.add_argument("worktree_name", help="Worktree name")
+    goto_parser.set_defaults(func=lambda m, a: m.goto_worktree(a.worktree_name))
 
     # info command
-    subparsers.add_parser("info", help="Show worktree path mapping info")
+    info_parser = subparsers.add_parser("info", help="Show worktree path mapping info")
+    info_parser.set_defaults(func=lambda m, a: m.show_info())
 
     args = parser.parse_args()
 
@@ -332,17 +350,7 @@ Examples:
         sys.exit(1)
 
     manager = WorktreeManager()
-
-    if args.command == "list":
-        manager.list_worktrees(args.repo)
-    elif args.command == "create":
-        manager.create_worktree(args.repo, args.branch)
-    elif args.command == "remove":
-        manager.remove_worktree(args.path)
-    elif args.command == "goto":
-        manager.goto_worktree(args.worktree_name)
-    elif args.command == "info":
-        manager.show_info()
+    args.func(manager, args)
 
 
 if __name__ == "__main__":
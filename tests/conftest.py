@@ -0,0 +1,44 @@
+"""Shared pytest configuration for the org-standards test suite.
+
+Puts python/ on sys.path once and re-exports the quality_gates names the
+unit tests use, so test modules can ``from conftest import ...``.
+"""
+
+import sys
+from pathlib import Path
+
+_PYTHON_DIR = str(Path(__file__).parent.parent / "python")
+if _PYTHON_DIR not in sys.path:
+    sys.path.insert(0, _PYTHON_DIR)
+
+import quality_gates  # noqa: E402
+from quality_gates import (  # noqa: E402
+    ExecutionResults,
+    GateConfig,
+    GateResult,
+    QualityGatesConfig,
+    _apply_stage_relaxations,
+    _detect_stage,
+    _matches_pattern,
+    _merge_configs,
+    _parse_config,
+    _should_skip_gate,
+    _validate_config,
+    load_config,
+)
+
+__all__ = [
+    "ExecutionResults",
+    "GateConfig",
+    "GateResult",
+    "QualityGatesConfig",
+    "_apply_stage_relaxations",
+    "_detect_stage",
+    "_matches_pattern",
+    "_merge_configs",
+    "_parse_config",
+    "_should_skip_gate",
+    "_validate_config",
+    "load_config",
+    "quality_gates",
+]
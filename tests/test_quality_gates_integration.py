@@ -5,127 +5,186 @@ Tests real hook execution with temporary git repositories.
 
 import json
 import os
+import re
+import shlex
 import shutil
 import subprocess
 from pathlib import Path
-from textwrap import dedent
 
 import pytest
+import yaml
+from quality_gates import load_config
+
+# org-standards checkout under test (handed to the hook via ORG_STANDARDS_DIR)
+ORG_STANDARDS_SRC = Path(__file__).parent.parent
+BASE_CONFIG = ORG_STANDARDS_SRC / "config" / "quality-gates.yaml"
+
+# Setup commands whose output is never inspected: drop stdout without a pipe,
+# leave stderr alone so a failing step still explains itself
+_quiet = {"stdout": subprocess.DEVNULL}
+
+# Fixture commits skip hooks and signing; optional index locks are not needed
+_GIT_COMMIT = "git -c commit.gpgsign=false commit --no-verify --quiet --allow-empty"
+_GIT_ENV = {**os.environ, "GIT_OPTIONAL_LOCKS": "0"}
+
+_PYPROJECT_TOML = """\
+[tool.pytest.ini_options]
+testpaths = ["tests"]
+
+[tool.coverage.run]
+source = ["src"]
+omit = [
+    "*/tests/*",
+    "*/playground/*",
+    "*/.ai-sessions/*",
+]
+"""
 
 # Fixtures
 
 
-@pytest.fixture
-def test_repo(tmp_path):
-    """Create test git repo with org-standards linked."""
-    repo = tmp_path / "test-repo"
-    repo.mkdir()
+@pytest.fixture(scope="session")
+def _dummy_remote(tmp_path_factory):
+    """Bare repo used as origin (needed for pre-push hook to trigger).
 
-    # Initialize git with main branch
-    subprocess.run(["git", "init", "-b", "main"], cwd=repo, check=True, capture_output=True)
-    subprocess.run(["git", "config", "user.name", "Test"], cwd=repo, check=True)
-    subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=repo, check=True)
+    Shared across the session: tests only dry-run pushes, so it never changes.
+    """
+    remote = tmp_path_factory.mktemp("remote") / "dummy-remote.git"
+    subprocess.run(["git", "init", "--bare", str(remote)], check=True, **_quiet)
+    return remote
 
-    # Create dummy bare git repo for origin (needed for pre-push hook to trigger)
-    dummy_remote = tmp_path / "dummy-remote.git"
-    subprocess.run(
-        ["git", "init", "--bare"],
-        cwd=tmp_path,
-        env={**os.environ, "GIT_DIR": str(dummy_remote)},
-        check=True,
-        capture_output=True,
-    )
-
-    # Add origin remote
-    subprocess.run(
-        ["git", "remote", "add", "origin", str(dummy_remote)],
-        cwd=repo,
-        check=True,
-    )
 
-    # Link org-standards (symlink to actual org-standards)
-    org_standards_src = Path(__file__).parent.parent
-    org_standards_link = repo / "org-standards"
-    org_standards_link.symlink_to(org_standards_src, target_is_directory=True)
+@pytest.fixture(scope="session")
+def _test_repo_template(tmp_path_factory, _dummy_remote):
+    """Build the test git repo once per session (test_repo hands out copies)."""
+    root = tmp_path_factory.mktemp("template")
+    repo = root / "test-repo"
+    repo.mkdir()
 
-    # Create initial commit (required for diff-cover)
+    # Initial commit content (required for diff-cover)
     readme = repo / "README.md"
     readme.write_text("# Test Repo\n")
-    subprocess.run(["git", "add", "."], cwd=repo, check=True)
-    subprocess.run(["git", "commit", "-m", "Initial commit"], cwd=repo, check=True)
 
     # Create pyproject.toml for pytest-cov
     pyproject = repo / "pyproject.toml"
-    pyproject.write_text(
-        dedent("""
-        [tool.pytest.ini_options]
-        testpaths = ["tests"]
-
-        [tool.coverage.run]
-        source = ["src"]
-        omit = [
-            "*/tests/*",
-            "*/playground/*",
-            "*/.ai-sessions/*",
-        ]
-    """)
-    )
+    pyproject.write_text(_PYPROJECT_TOML)
 
     # Create src and tests directories
     (repo / "src").mkdir()
     (repo / "tests").mkdir()
 
-    # Add pyproject.toml
-    subprocess.run(["git", "add", "pyproject.toml"], cwd=repo, check=True)
-    subprocess.run(["git", "commit", "-m", "Add pyproject.toml"], cwd=repo, check=True)
+    # All git setup in one shell: init with main branch, origin remote,
+    # and the two initial commits
+    setup = " && ".join(
+        [
+            "git init -b main",
+            "git config user.name Test",
+            "git config user.email test@example.com",
+            f"git remote add origin {shlex.quote(str(_dummy_remote))}",
+            "git add README.md",
+            f"{_GIT_COMMIT} -m 'Initial commit'",
+            "git add pyproject.toml",
+            f"{_GIT_COMMIT} -m 'Add pyproject.toml'",
+        ]
+    )
+    subprocess.run(["bash", "-c", setup], cwd=repo, check=True, env=_GIT_ENV, **_quiet)
 
-    # Install pre-push hook
-    hook_src = org_standards_src / "git-hooks" / "pre-push"
+    # Install pre-push hook (link, so the executable bit and edits carry over)
+    hook_src = ORG_STANDARDS_SRC / "git-hooks" / "pre-push"
     hook_dest = repo / ".git" / "hooks" / "pre-push"
-    shutil.copy(hook_src, hook_dest)
-    hook_dest.chmod(0o755)
+    try:
+        os.link(hook_src, hook_dest)
+    except OSError:
+        # Different filesystem (e.g. tmp on tmpfs) - fall back to a symlink
+        os.symlink(hook_src, hook_dest)
 
     return repo
 
 
 @pytest.fixture
-def disable_hook(test_repo):
-    """Temporarily disable pre-push hook."""
-    hook = test_repo / ".git" / "hooks" / "pre-push"
-    hook_backup = test_repo / ".git" / "hooks" / "pre-push.bak"
-    if hook.exists():
-        hook.rename(hook_backup)
-    yield
-    # Restore hook if backup exists
-    if hook_backup.exists() and not hook.exists():
-        hook_backup.rename(hook)
+def test_repo(tmp_path, _test_repo_template):
+    """Create test git repo with the org-standards pre-push hook installed.
+
+    Copies the session template so each test gets an isolated repo without
+    repeating git init, initial commits and hook install. The copy shares the
+    session-wide origin remote.
+    """
+    repo = tmp_path / "test-repo"
+    shutil.copytree(_test_repo_template, repo, symlinks=True)
+    return repo
+
+
+@pytest.fixture(scope="session")
+def _hook_content():
+    """Source of the org-standards pre-push hook, read once per session."""
+    return (ORG_STANDARDS_SRC / "git-hooks" / "pre-push").read_text()
+
+
+class HookToggle:
+    """Switch for the repo's pre-push hook; renames only on a state change."""
+
+    def __init__(self, repo: Path):
+        hooks_dir = repo / ".git" / "hooks"
+        self.hook = hooks_dir / "pre-push"
+        self.backup = hooks_dir / "pre-push.bak"
+        self.enabled = self.hook.exists()
+
+    def enable(self):
+        if not self.enabled:
+            self.backup.rename(self.hook)
+            self.enabled = True
+
+    def disable(self):
+        if self.enabled:
+            self.hook.rename(self.backup)
+            self.enabled = False
+
+
+@pytest.fixture
+def hook_toggle(test_repo):
+    """Pre-push hook disabled until the test calls enable()."""
+    toggle = HookToggle(test_repo)
+    toggle.disable()
+    return toggle
 
 
 # Helper Functions
 
 
-def create_code_file(repo: Path, relative_path: str, content: str):
-    """Create code file in repo."""
+def write_file(repo: Path, relative_path: str, content: str):
+    """Write file into repo, creating parent directories."""
     file_path = repo / relative_path
     file_path.parent.mkdir(parents=True, exist_ok=True)
-    file_path.write_text(dedent(content).strip() + "\n")
+    file_path.write_text(content)
 
 
 def git_add_commit(repo: Path, message: str):
     """Git add all and commit."""
-    subprocess.run(["git", "add", "."], cwd=repo, check=True)
-    subprocess.run(["git", "commit", "-m", message], cwd=repo, check=True)
+    subprocess.run(
+        ["bash", "-c", f'git add -A && {_GIT_COMMIT} -m "$1"', "_", message],
+        cwd=repo,
+        check=True,
+        env=_GIT_ENV,
+        **_quiet,
+    )
 
 
 def git_push(repo: Path, env: dict = None) -> subprocess.CompletedProcess:
-    """Attempt git push (triggers pre-push hook)."""
-    # Create a dummy remote (we're not actually pushing anywhere)
+    """Run the pre-push hook the way `git push origin main` would.
+
+    Invokes the hook directly (no git push process in between) with git's
+    arguments (remote name, remote URL) and ref line on stdin.
+    """
+    git_dir = repo / ".git"
+    remote_url = re.search(r'\[remote "origin"\][^[]*?url = (.+)', (git_dir / "config").read_text()).group(1)
+    local_sha = (git_dir / "refs" / "heads" / "main").read_text().strip()
     result = subprocess.run(
-        ["git", "push", "--dry-run", "origin", "main"],
+        [str(git_dir / "hooks" / "pre-push"), "origin", remote_url],
         cwd=repo,
+        input=f"refs/heads/main {local_sha} refs/heads/main {'0' * 40}\n",
         capture_output=True,
         text=True,
-        env={**os.environ, **(env or {})},
+        env={**os.environ, "GIT_DIR": str(git_dir), "ORG_STANDARDS_DIR": str(ORG_STANDARDS_SRC), **(env or {})},
     )
     return result
 
@@ -133,118 +192,132 @@ def git_push(repo: Path, env: dict = None) -> subprocess.CompletedProcess:
 # Integration Tests
 
 
-def test_hook_blocks_low_coverage(test_repo, disable_hook):
-    """Hook blocks push when diff coverage <80%."""
-    # Create file with untested code
-    create_code_file(
-        test_repo,
-        "src/calculator.py",
-        """
-        def add(a, b):
-            return a + b
+_CALC_THREE_OPS_SRC = """\
+def add(a, b):
+    return a + b
 
-        def subtract(a, b):
-            return a - b
+def subtract(a, b):
+    return a - b
 
-        def multiply(a, b):
-            return a * b
-    """,
-    )
+def multiply(a, b):
+    return a * b
+"""
 
-    # Create partial tests (only 1/3 functions = 33%)
-    create_code_file(
-        test_repo,
-        "tests/test_calculator.py",
-        """
-        from src.calculator import add
+_CALC_ADD_TEST_SRC = """\
+from src.calculator import add
 
-        def test_add():
-            assert add(2, 3) == 5
-    """,
-    )
+def test_add():
+    assert add(2, 3) == 5
+"""
 
-    git_add_commit(test_repo, "Add calculator with partial tests")
+_CALC_SRC = """\
+def add(a, b):
+    return a + b
 
-    # Re-enable hook
-    hook_backup = test_repo / ".git" / "hooks" / "pre-push.bak"
-    hook = test_repo / ".git" / "hooks" / "pre-push"
-    hook_backup.rename(hook)
+def subtract(a, b):
+    return a - b
+"""
 
-    # Push (should fail)
-    result = git_push(test_repo)
+_CALC_FULL_TEST_SRC = """\
+from src.calculator import add, subtract
 
-    # Note: Hook will fail because tools not installed in test env
-    # This test validates hook structure, not actual coverage checking
-    output = (result.stdout + result.stderr).lower()
-    assert result.returncode != 0 or "quality gate" in output
+def test_add():
+    assert add(2, 3) == 5
 
+def test_subtract():
+    assert subtract(5, 3) == 2
+"""
 
-def test_hook_allows_high_coverage(test_repo, disable_hook):
-    """Hook allows push when diff coverage ≥80%."""
-    # Create file with well-tested code
-    create_code_file(
-        test_repo,
-        "src/calculator.py",
-        """
-        def add(a, b):
-            return a + b
-
-        def subtract(a, b):
-            return a - b
-    """,
-    )
+_UNTESTED_SRC = """\
+def untested():
+    pass
+"""
 
-    # Create comprehensive tests (100%)
-    create_code_file(
-        test_repo,
-        "tests/test_calculator.py",
-        """
-        from src.calculator import add, subtract
+_EXPERIMENT_SRC = """\
+def experiment():
+    # No tests needed - exploratory
+    pass
+"""
 
-        def test_add():
-            assert add(2, 3) == 5
+_MAIN_SRC = """\
+def main():
+    pass
+"""
 
-        def test_subtract():
-            assert subtract(5, 3) == 2
-    """,
-    )
+_MAIN_TEST_SRC = """\
+from src.main import main
 
-    git_add_commit(test_repo, "Add calculator with full tests")
+def test_main():
+    main()
+"""
 
-    # Re-enable hook
-    hook_backup = test_repo / ".git" / "hooks" / "pre-push.bak"
-    hook = test_repo / ".git" / "hooks" / "pre-push"
-    hook_backup.rename(hook)
+HOOK_SCENARIOS = [
+    (
+        # Untested code: only 1/3 functions covered (33%) - hook blocks push
+        "low_coverage",
+        {
+            "src/calculator.py": _CALC_THREE_OPS_SRC,
+            "tests/test_calculator.py": _CALC_ADD_TEST_SRC,
+        },
+        None,
+        # Hook fails when tools are missing in the test env; this validates
+        # hook structure, not actual coverage checking
+        lambda result, output: result.returncode != 0 or "quality gate" in output.lower(),
+    ),
+    (
+        # Fully tested code (100%) - hook allows push if tools are installed
+        "high_coverage",
+        {
+            "src/calculator.py": _CALC_SRC,
+            "tests/test_calculator.py": _CALC_FULL_TEST_SRC,
+        },
+        None,
+        lambda result, output: "quality gate" in output.lower() or result.returncode == 0,
+    ),
+    (
+        # Emergency bypass skips all gates
+        "emergency_bypass",
+        {"src/untested.py": _UNTESTED_SRC},
+        {"EMERGENCY_PUSH": "1", "EMERGENCY_REASON": "Production outage - rollback needed"},
+        lambda result, output: result.returncode == 0 or "EMERGENCY PUSH" in output,
+    ),
+    (
+        # Untested code in playground/ is omitted from coverage
+        "exploratory_code_exempt",
+        {
+            "playground/experiment.py": _EXPERIMENT_SRC,
+            "src/main.py": _MAIN_SRC,
+            "tests/test_main.py": _MAIN_TEST_SRC,
+        },
+        None,
+        lambda result, output: "quality gate" in output.lower() or result.returncode == 0,
+    ),
+]
 
-    # Push (should succeed if tools installed, or fail gracefully)
-    result = git_push(test_repo)
 
-    # Validate hook executed (check both stdout and stderr)
-    output = (result.stdout + result.stderr).lower()
-    assert "quality gate" in output or result.returncode == 0
+@pytest.mark.parametrize(
+    "name, files, env, assertion",
+    HOOK_SCENARIOS,
+    ids=[scenario[0] for scenario in HOOK_SCENARIOS],
+)
+def test_hook_behavior(test_repo, hook_toggle, name, files, env, assertion):
+    """Hook outcome for each commit scenario."""
+    for relative_path, content in files.items():
+        write_file(test_repo, relative_path, content)
 
+    git_add_commit(test_repo, f"Add {name} scenario")
 
-def test_emergency_bypass_logs_json(test_repo, disable_hook):
-    """Emergency bypass skips gates and logs JSON."""
-    # Create untested code
-    create_code_file(
-        test_repo,
-        "src/untested.py",
-        """
-        def untested():
-            pass
-    """,
-    )
+    # Re-enable hook
+    hook_toggle.enable()
 
-    git_add_commit(test_repo, "Emergency fix")
+    result = git_push(test_repo, env=env)
+
+    assert assertion(result, result.stdout + result.stderr)
 
-    # Re-enable hook
-    hook_backup = test_repo / ".git" / "hooks" / "pre-push.bak"
-    hook = test_repo / ".git" / "hooks" / "pre-push"
-    hook_backup.rename(hook)
 
-    # Push with emergency bypass
-    result = git_push(
+def test_emergency_bypass_logs_json(test_repo):
+    """Emergency bypass logs a JSON record of who bypassed and why."""
+    git_push(
         test_repo,
         env={
             "EMERGENCY_PUSH": "1",
@@ -252,108 +325,25 @@ def test_emergency_bypass_logs_json(test_repo, disable_hook):
         },
     )
 
-    # Should succeed (bypassed)
-    output = result.stdout + result.stderr
-    assert result.returncode == 0 or "EMERGENCY PUSH" in output
+    json_files = list((test_repo / ".emergency-bypasses").glob("*.json"))
+    assert len(json_files) == 1
+    with open(json_files[0]) as f:
+        bypass_data = json.load(f)
 
-    # Check JSON log created
-    bypass_dir = test_repo / ".emergency-bypasses"
-    if bypass_dir.exists():
-        json_files = list(bypass_dir.glob("*.json"))
-        if json_files:
-            with open(json_files[0]) as f:
-                bypass_data = json.load(f)
-
-            assert "reason" in bypass_data
-            assert bypass_data["reason"] == "Production outage - rollback needed"
-            assert "timestamp" in bypass_data
-            assert "user" in bypass_data
-
-
-def test_exploratory_code_exempt(test_repo, disable_hook):
-    """Code in playground/ is omitted from coverage."""
-    # Create untested exploratory code
-    create_code_file(
-        test_repo,
-        "playground/experiment.py",
-        """
-        def experiment():
-            # No tests needed - exploratory
-            pass
-    """,
-    )
-
-    # Create production code with tests
-    create_code_file(
-        test_repo,
-        "src/main.py",
-        """
-        def main():
-            pass
-    """,
-    )
-
-    create_code_file(
-        test_repo,
-        "tests/test_main.py",
-        """
-        from src.main import main
-
-        def test_main():
-            main()
-    """,
-    )
+    assert bypass_data["reason"] == "Production outage - rollback needed"
+    assert "timestamp" in bypass_data
+    assert "user" in bypass_data
 
-    git_add_commit(test_repo, "Add exploratory + prod code")
 
-    # Re-enable hook
-    hook_backup = test_repo / ".git" / "hooks" / "pre-push.bak"
-    hook = test_repo / ".git" / "hooks" / "pre-push"
-    hook_backup.rename(hook)
-
-    # Push (playground should be omitted)
-    result = git_push(test_repo)
-
-    # Hook should execute (success depends on tool availability)
-    output = (result.stdout + result.stderr).lower()
-    assert "quality gate" in output or result.returncode == 0
-
-
-def test_hook_loads_config(test_repo):
+def test_hook_loads_config():
     """Hook successfully loads quality-gates.yaml."""
-    # Create a simple test that just loads config
-    test_script = test_repo / "test_config_load.py"
-    test_script.write_text(
-        dedent("""
-        import sys
-        from pathlib import Path
-
-        sys.path.insert(0, str(Path('org-standards/python')))
-
-        try:
-            from quality_gates import load_config
-            config = load_config(base_config=Path('org-standards/config/quality-gates.yaml'))
-            print(f'✅ Loaded config version {config.version}')
-            print(f'✅ Found {len(config.gates)} gates')
-            sys.exit(0)
-        except Exception as e:
-            print(f'❌ Failed to load config: {e}')
-            sys.exit(1)
-    """)
-    )
+    config = load_config(base_config=BASE_CONFIG)
 
-    result = subprocess.run(
-        ["python3", "test_config_load.py"],
-        cwd=test_repo,
-        capture_output=True,
-        text=True,
-    )
-
-    assert result.returncode == 0
-    assert "Loaded config version" in result.stdout
+    assert config.version
+    assert len(config.gates) > 0
 
 
-def test_hook_is_executable_and_contains_quality_gates(test_repo):
+def test_hook_is_executable_and_contains_quality_gates(test_repo, _hook_content):
     """Hook is executable and contains quality gate logic."""
     hook_script = test_repo / ".git" / "hooks" / "pre-push"
 
@@ -362,105 +352,29 @@ def test_hook_is_executable_and_contains_quality_gates(test_repo):
     assert hook_script.stat().st_mode & 0o111  # Check executable bit
 
     # Verify hook contains quality gate logic
-    content = hook_script.read_text()
-    assert "quality_gates" in content
-    assert "EMERGENCY_PUSH" in content
+    assert "quality_gates" in _hook_content
+    assert "EMERGENCY_PUSH" in _hook_content
 
 
-def test_repo_specific_override(test_repo, disable_hook):
+def test_repo_specific_override(tmp_path):
     """Local override file customizes threshold."""
     # Create override config
-    override = test_repo / "quality-gates.local.yaml"
-    override.write_text(
-        dedent("""
-        gates:
-          coverage:
-            threshold: 60
-    """)
-    )
+    override = tmp_path / "quality-gates.local.yaml"
+    override.write_text("gates:\n  coverage:\n    threshold: 60\n")
 
-    # Test that override is loaded
-    test_script = test_repo / "test_override.py"
-    test_script.write_text(
-        dedent("""
-        import sys
-        from pathlib import Path
+    config = load_config(base_config=BASE_CONFIG, override_config=override)
 
-        sys.path.insert(0, str(Path('org-standards/python')))
+    assert config.gates["coverage"].threshold == 60
 
-        from quality_gates import load_config
 
-        config = load_config(
-            base_config=Path('org-standards/config/quality-gates.yaml'),
-            override_config=Path('quality-gates.local.yaml')
-        )
-
-        threshold = config.gates['coverage'].threshold
-        print(f'Threshold: {threshold}')
-
-        if threshold == 60:
-            print('✅ Override applied (60)')
-            sys.exit(0)
-        else:
-            print(f'❌ Override not applied (got {threshold}, expected 60)')
-            sys.exit(1)
-    """)
-    )
-
-    result = subprocess.run(
-        ["python3", "test_override.py"],
-        cwd=test_repo,
-        capture_output=True,
-        text=True,
-    )
-
-    assert result.returncode == 0
-    assert "Override applied" in result.stdout
-
-
-def test_config_validation_in_hook(test_repo):
+def test_config_validation_in_hook(tmp_path):
     """Hook validates config before executing gates."""
-    # Corrupt the config
-    config_file = test_repo / "org-standards" / "config" / "quality-gates.yaml"
-    original_content = config_file.read_text()
+    # Corrupt a scratch copy of the config (never the shared org-standards file)
+    config_file = tmp_path / "quality-gates.yaml"
+    config_file.write_text("invalid: yaml: syntax: error: [")
 
-    try:
-        # Write invalid YAML
-        config_file.write_text("invalid: yaml: syntax: error: [")
-
-        # Try to load config
-        test_script = test_repo / "test_invalid_config.py"
-        test_script.write_text(
-            dedent("""
-            import sys
-            from pathlib import Path
-
-            sys.path.insert(0, str(Path('org-standards/python')))
-
-            try:
-                from quality_gates import load_config
-                config = load_config(base_config=Path('org-standards/config/quality-gates.yaml'))
-                print('❌ Should have failed on invalid YAML')
-                sys.exit(1)
-            except Exception as e:
-                print(f'✅ Caught invalid config: {type(e).__name__}')
-                sys.exit(0)
-        """)
-        )
-
-        result = subprocess.run(
-            ["python3", "test_invalid_config.py"],
-            cwd=test_repo,
-            capture_output=True,
-            text=True,
-        )
-
-        # Should catch the error
-        assert "Caught invalid config" in result.stdout or result.returncode == 0
-
-    finally:
-        # Restore original config
-        config_file.write_text(original_content)
+    with pytest.raises(yaml.YAMLError):
+        load_config(base_config=config_file)
 
 
 if __name__ == "__main__":
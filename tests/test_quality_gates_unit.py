@@ -3,16 +3,14 @@
 Tests configuration loading, validation, and parsing logic.
 """
 
-import sys
+import copy
+import re
+import shutil
 from pathlib import Path
 
 import pytest
 import yaml
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "python"))
-
-from quality_gates import (
+from conftest import (
     ExecutionResults,
     GateConfig,
     GateResult,
@@ -23,14 +21,27 @@ from quality_gates import (
     _should_skip_gate,
     _validate_config,
     load_config,
+    quality_gates,
 )
 
+# libyaml-backed dumper when available (matches the loader used by quality_gates)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Expected error messages, compiled once for pytest.raises(match=...)
+RE_MISSING_VERSION = re.compile(r"Missing required fields.*version")
+RE_MISSING_GATES = re.compile(r"Missing required fields.*gates")
+RE_MISSING_EXECUTION_ORDER = re.compile(r"Missing required fields.*execution_order")
+RE_UNDEFINED_GATE = re.compile(r"execution_order references undefined gates.*coverage")
+RE_CIRCULAR_DEPENDENCY = re.compile(r"Circular dependency in gates.*gate_a.*gate_b")
+RE_CYCLE_MEMBERS_ONLY = re.compile(re.escape("Circular dependency in gates: ['a', 'b']"))
+RE_CONFIG_NOT_FOUND = re.compile(r"Config not found")
+
 # Fixtures
 
 
-@pytest.fixture
-def valid_config_dict():
-    """Valid configuration dictionary."""
+@pytest.fixture(scope="session")
+def _valid_config_baseline():
+    """Valid configuration dictionary, built once (never hand out directly)."""
     return {
         "version": "1.0.0",
         "gates": {
@@ -63,6 +74,43 @@ def valid_config_dict():
 
 
 @pytest.fixture
+def valid_config_dict(_valid_config_baseline):
+    """Valid configuration dictionary (private copy; safe to mutate)."""
+    return copy.deepcopy(_valid_config_baseline)
+
+
+@pytest.fixture(scope="session")
+def base_config_path(tmp_path_factory, _valid_config_baseline):
+    """Valid configuration written to a YAML file once per session."""
+    config_file = tmp_path_factory.mktemp("config") / "quality-gates.yaml"
+    config_file.write_bytes(yaml.dump(_valid_config_baseline, Dumper=YAML_DUMPER).encode())
+    return config_file
+
+
+@pytest.fixture
+def load_stub(monkeypatch):
+    """Serve load_config from in-memory dicts instead of YAML files.
+
+    Register documents by absolute path: ``load_stub["/cfg/base.yaml"] = {...}``.
+    Unregistered paths behave as missing files.
+    """
+    stubs: dict[str, dict] = {}
+
+    def _stamp(path):
+        return (0, 0) if path in stubs else None
+
+    def _load(path, *args):
+        return copy.deepcopy(stubs[path])
+
+    monkeypatch.setattr(quality_gates, "_file_stamp", _stamp)
+    monkeypatch.setattr(quality_gates, "_load_yaml_cached", _load)
+    monkeypatch.setattr(quality_gates, "_read_yaml_cached", _load)
+    quality_gates._load_config_cached.cache_clear()
+    yield stubs
+    quality_gates._load_config_cached.cache_clear()
+
+
+@pytest.fixture(scope="session")
 def invalid_config_missing_version():
     """Invalid config - missing version."""
     return {
@@ -71,7 +119,7 @@ def invalid_config_missing_version():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_config_undefined_gate():
     """Invalid config - execution_order references undefined gate."""
     return {
@@ -88,7 +136,7 @@ def invalid_config_undefined_gate():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config_with_circular_dependency():
     """Config with circular dependency."""
     return {
@@ -124,82 +172,96 @@ def test_validate_config_valid(valid_config_dict):
 
 def test_validate_config_missing_version(invalid_config_missing_version):
     """Config missing 'version' fails validation."""
-    with pytest.raises(ValueError, match="Missing required fields.*version"):
+    with pytest.raises(ValueError, match=RE_MISSING_VERSION):
         _validate_config(invalid_config_missing_version)
 
 
 def test_validate_config_missing_gates():
     """Config missing 'gates' fails validation."""
     config = {"version": "1.0.0", "execution_order": []}
-    with pytest.raises(ValueError, match="Missing required fields.*gates"):
+    with pytest.raises(ValueError, match=RE_MISSING_GATES):
         _validate_config(config)
 
 
 def test_validate_config_missing_execution_order():
     """Config missing 'execution_order' fails validation."""
     config = {"version": "1.0.0", "gates": {}}
-    with pytest.raises(ValueError, match="Missing required fields.*execution_order"):
+    with pytest.raises(ValueError, match=RE_MISSING_EXECUTION_ORDER):
         _validate_config(config)
 
 
 def test_validate_config_undefined_gate_in_order(invalid_config_undefined_gate):
     """Config with undefined gate in execution_order fails."""
-    with pytest.raises(ValueError, match="execution_order references undefined gates.*coverage"):
+    with pytest.raises(ValueError, match=RE_UNDEFINED_GATE):
         _validate_config(invalid_config_undefined_gate)
 
 
-# Unit Tests - Configuration Merging
-
+def test_validate_config_circular_dependency(config_with_circular_dependency):
+    """Config whose gates depend on each other fails validation."""
+    with pytest.raises(ValueError, match=RE_CIRCULAR_DEPENDENCY):
+        _validate_config(config_with_circular_dependency)
 
-def test_merge_configs_empty_override(valid_config_dict):
-    """Merging empty override returns base config."""
-    result = _merge_configs(valid_config_dict, {})
-    assert result == valid_config_dict
 
-
-def test_merge_configs_gate_override(valid_config_dict):
-    """Override can modify gate properties."""
-    override = {
+def test_validate_config_circular_dependency_names_only_cycle_members():
+    """Gates that merely depend on a cycle are not reported as part of it."""
+    config = {
+        "version": "1.0.0",
         "gates": {
-            "coverage": {
-                "threshold": 70  # Override 80 -> 70
-            }
-        }
+            "a": {"depends_on": ["b"]},
+            "b": {"depends_on": ["a"]},
+            "c": {"depends_on": ["a"]},
+            "d": {"depends_on": ["c"]},
+        },
+        "execution_order": ["a", "b", "c", "d"],
     }
-    result = _merge_configs(valid_config_dict, override)
-    assert result["gates"]["coverage"]["threshold"] == 70
-    assert result["gates"]["coverage"]["tool"] == "diff-cover"  # Unchanged
+    with pytest.raises(ValueError, match=RE_CYCLE_MEMBERS_ONLY):
+        _validate_config(config)
 
 
-def test_merge_configs_add_new_gate(valid_config_dict):
-    """Override can add new gates."""
-    override = {
-        "gates": {
-            "linting": {
-                "enabled": True,
-                "tool": "ruff",
-                "description": "Lint code",
-                "required": True,
-            }
-        }
-    }
-    result = _merge_configs(valid_config_dict, override)
-    assert "linting" in result["gates"]
-    assert result["gates"]["linting"]["tool"] == "ruff"
+# Unit Tests - Configuration Merging
 
 
-def test_merge_configs_override_version(valid_config_dict):
-    """Override can change version."""
-    override = {"version": "2.0.0"}
+MERGE_CASES = [
+    pytest.param({}, lambda r, base: r == base, id="empty_override"),
+    pytest.param(
+        {"gates": {"coverage": {"threshold": 70}}},  # Override 80 -> 70
+        # Threshold overridden, tool unchanged
+        lambda r, base: r["gates"]["coverage"]["threshold"] == 70 and r["gates"]["coverage"]["tool"] == "diff-cover",
+        id="gate_override",
+    ),
+    pytest.param(
+        {"gates": {"linting": {"enabled": True, "tool": "ruff", "description": "Lint code", "required": True}}},
+        lambda r, base: r["gates"]["linting"]["tool"] == "ruff" and "testing" in r["gates"],
+        id="add_new_gate",
+    ),
+    pytest.param({"version": "2.0.0"}, lambda r, base: r["version"] == "2.0.0", id="override_version"),
+    pytest.param(
+        {"execution_order": ["coverage", "testing"]},
+        lambda r, base: r["execution_order"] == ["coverage", "testing"],
+        id="override_execution_order",
+    ),
+    pytest.param(
+        {"override_file": "other.yaml"},
+        lambda r, base: "override_file" not in r,
+        id="ignores_other_keys",
+    ),
+]
+
+
+@pytest.mark.parametrize("override,check", MERGE_CASES)
+def test_merge_configs(valid_config_dict, override, check):
+    """Overrides replace or extend base values as expected."""
+    assert check(_merge_configs(valid_config_dict, override), valid_config_dict)
+
+
+def test_merge_configs_nested_without_mutating_base(valid_config_dict):
+    """Gate overrides merge key-by-key and leave base untouched."""
+    original = copy.deepcopy(valid_config_dict)
+    override = {"gates": {"coverage": {"threshold": 70}}}
     result = _merge_configs(valid_config_dict, override)
-    assert result["version"] == "2.0.0"
-
 
-def test_merge_configs_override_execution_order(valid_config_dict):
-    """Override can change execution order."""
-    override = {"execution_order": ["coverage", "testing"]}
-    result = _merge_configs(valid_config_dict, override)
-    assert result["execution_order"] == ["coverage", "testing"]
+    assert result["gates"]["coverage"]["threshold"] == 70
+    assert valid_config_dict == original
 
 
 # Unit Tests - Configuration Parsing
@@ -227,29 +289,25 @@ def test_parse_config_handles_optional_fields(valid_config_dict):
 
     testing = config.gates["testing"]
     assert testing.threshold is None  # Optional, not provided
-    assert testing.depends_on == []  # Default empty list
+    assert testing.depends_on == ()  # Default empty tuple
 
     coverage = config.gates["coverage"]
     assert coverage.threshold == 80  # Provided
-    assert coverage.depends_on == ["testing"]  # Provided
+    assert coverage.depends_on == ("testing",)  # Provided
 
 
 def test_parse_config_preserves_execution_order(valid_config_dict):
     """Parsing preserves execution order."""
     config = _parse_config(valid_config_dict)
-    assert config.execution_order == ["testing", "coverage"]
+    assert config.execution_order == ("testing", "coverage")
 
 
 # Unit Tests - Configuration Loading
 
 
-def test_load_config_valid_file(tmp_path, valid_config_dict):
+def test_load_config_valid_file(base_config_path):
     """Loading valid config file succeeds."""
-    config_file = tmp_path / "quality-gates.yaml"
-    with open(config_file, "w") as f:
-        yaml.dump(valid_config_dict, f)
-
-    config = load_config(base_config=config_file)
+    config = load_config(base_config=base_config_path)
 
     assert isinstance(config, QualityGatesConfig)
     assert config.version == "1.0.0"
@@ -258,23 +316,16 @@ def test_load_config_valid_file(tmp_path, valid_config_dict):
 
 def test_load_config_file_not_found():
     """Loading non-existent file raises FileNotFoundError."""
-    with pytest.raises(FileNotFoundError, match="Config not found"):
+    with pytest.raises(FileNotFoundError, match=RE_CONFIG_NOT_FOUND):
         load_config(base_config=Path("/nonexistent/file.yaml"))
 
 
-def test_load_config_with_override(tmp_path, valid_config_dict):
+def test_load_config_with_override(load_stub, valid_config_dict):
     """Loading config with override merges correctly."""
-    base_file = tmp_path / "base.yaml"
-    override_file = tmp_path / "override.yaml"
-
-    with open(base_file, "w") as f:
-        yaml.dump(valid_config_dict, f)
+    load_stub["/cfg/base.yaml"] = valid_config_dict
+    load_stub["/cfg/override.yaml"] = {"gates": {"coverage": {"threshold": 60}}}
 
-    override = {"gates": {"coverage": {"threshold": 60}}}
-    with open(override_file, "w") as f:
-        yaml.dump(override, f)
-
-    config = load_config(base_config=base_file, override_config=override_file)
+    config = load_config(base_config="/cfg/base.yaml", override_config="/cfg/override.yaml")
 
     assert config.gates["coverage"].threshold == 60  # Overridden
     assert config.gates["testing"].tool == "pytest"  # Unchanged
@@ -282,89 +333,119 @@ def test_load_config_with_override(tmp_path, valid_config_dict):
 
 def test_load_config_override_file_missing(tmp_path, valid_config_dict):
     """Loading with non-existent override file uses base only."""
-    base_file = tmp_path / "base.yaml"
-    with open(base_file, "w") as f:
-        yaml.dump(valid_config_dict, f)
-
-    override_file = tmp_path / "nonexistent.yaml"
-
-    config = load_config(base_config=base_file, override_config=override_file)
+    config = load_config(base_data=valid_config_dict, override_config=tmp_path / "nonexistent.yaml")
 
     # Should succeed with base config only
     assert config.version == "1.0.0"
 
 
-# Unit Tests - Gate Results
+def test_load_config_memoized_until_file_changes(tmp_path, base_config_path):
+    """Repeated loads reuse the parsed config until a file changes."""
+    override_file = tmp_path / "override.yaml"
 
+    first = load_config(base_config=base_config_path, override_config=override_file)
+    assert load_config(base_config=base_config_path, override_config=override_file) is first
 
-def test_gate_result_success():
-    """GateResult for successful gate."""
-    result = GateResult(
-        gate_name="testing",
-        passed=True,
-        duration_seconds=5.2,
-        message="All tests passed",
-    )
-    assert result.passed is True
-    assert result.gate_name == "testing"
-    assert result.duration_seconds == 5.2
-
-
-def test_gate_result_failure():
-    """GateResult for failed gate."""
-    result = GateResult(
-        gate_name="coverage",
-        passed=False,
-        duration_seconds=2.1,
-        message="Coverage 70% (need 80%)",
-        fail_message="Add more tests",
-    )
-    assert result.passed is False
-    assert result.fail_message == "Add more tests"
+    # Creating the override file invalidates the cached result
+    override_file.write_bytes(yaml.dump({"gates": {"coverage": {"threshold": 55}}}, Dumper=YAML_DUMPER).encode())
 
+    config = load_config(base_config=base_config_path, override_config=override_file)
+    assert config is not first
+    assert config.gates["coverage"].threshold == 55
 
-# Unit Tests - Execution Results
 
+def test_loaded_config_containers_are_read_only(base_config_path):
+    """Shared memoized configs cannot be changed through their containers."""
+    config = load_config(base_config=base_config_path)
 
-def test_execution_results_all_passed():
-    """ExecutionResults when all gates pass."""
-    results = [
-        GateResult("testing", True, 5.0),
-        GateResult("coverage", True, 2.0),
-    ]
+    with pytest.raises(TypeError):
+        config.gates["testing"] = config.gates["coverage"]
+    with pytest.raises(TypeError):
+        config.emergency_bypass["enabled"] = False
+    with pytest.raises(AttributeError):
+        config.execution_order.append("testing")
+
+
+def test_load_config_default_override_skips_deepcopy(monkeypatch, tmp_path, base_config_path):
+    """Memoized loads that resolve the default override do not copy the base document."""
+    monkeypatch.chdir(tmp_path)
+    first = load_config(base_config=base_config_path)
+
+    copies = []
+    monkeypatch.setattr(quality_gates.copy, "deepcopy", lambda obj, *args: copies.append(obj) or obj)
+
+    assert load_config(base_config=base_config_path) is first
+    assert copies == []
+
+
+def test_load_yaml_cached_returns_independent_copies(tmp_path, base_config_path, valid_config_dict):
+    """Cached YAML parses are handed out as copies and refreshed on change."""
+    config_file = tmp_path / "quality-gates.yaml"
+    shutil.copy(base_config_path, config_file)
+
+    first = quality_gates._load_yaml_cached(str(config_file))
+    first["gates"]["coverage"]["threshold"] = 0
+    assert quality_gates._load_yaml_cached(str(config_file)) == valid_config_dict
+
+    config_file.write_bytes(yaml.dump({"version": "2.0.0"}, Dumper=YAML_DUMPER).encode())
+
+    assert quality_gates._load_yaml_cached(str(config_file)) == {"version": "2.0.0"}
 
-    exec_results = ExecutionResults(
-        passed=True,
-        failed_count=0,
-        total_count=2,
-        duration_seconds=7.0,
-        results=results,
-        failures=[],
-    )
 
-    assert exec_results.passed is True
-    assert exec_results.failed_count == 0
-    assert len(exec_results.failures) == 0
+# Unit Tests - Gate Results
+
 
+@pytest.mark.parametrize(
+    "fields",
+    [
+        pytest.param(
+            {"gate_name": "testing", "passed": True, "duration_seconds": 5.2, "message": "All tests passed"},
+            id="success",
+        ),
+        pytest.param(
+            {
+                "gate_name": "coverage",
+                "passed": False,
+                "duration_seconds": 2.1,
+                "message": "Coverage 70% (need 80%)",
+                "fail_message": "Add more tests",
+            },
+            id="failure",
+        ),
+    ],
+)
+def test_gate_result(fields):
+    """GateResult keeps the values it was built with."""
+    result = GateResult(**fields)
+    for name, value in fields.items():
+        assert getattr(result, name) == value
+
+
+# Unit Tests - Execution Results
 
-def test_execution_results_some_failed():
-    """ExecutionResults when some gates fail."""
-    pass_result = GateResult("testing", True, 5.0)
-    fail_result = GateResult("coverage", False, 2.0, "Too low")
+# GateResult is frozen, so these instances are shared across cases
+_PASS = GateResult("testing", True, 5.0)
+_FAIL = GateResult("coverage", False, 2.0, "Too low")
 
+
+@pytest.mark.parametrize(
+    "results,failed_names",
+    [
+        pytest.param([_PASS], [], id="all_passed"),
+        pytest.param([_PASS, _FAIL], ["coverage"], id="some_failed"),
+    ],
+)
+def test_execution_results(results, failed_names):
+    """failures and failed_count are derived from the failing results."""
     exec_results = ExecutionResults(
-        passed=False,
-        failed_count=1,
-        total_count=2,
+        passed=not failed_names,
+        total_count=len(results),
         duration_seconds=7.0,
-        results=[pass_result, fail_result],
-        failures=[fail_result],
+        results=results,
     )
 
-    assert exec_results.passed is False
-    assert exec_results.failed_count == 1
-    assert len(exec_results.failures) == 1
-    assert exec_results.failures[0].gate_name == "coverage"
+    assert exec_results.failed_count == len(failed_names)
+    assert [r.gate_name for r in exec_results.failures] == failed_names
 
 
 # Unit Tests - GateConfig
@@ -383,8 +464,8 @@ def test_gate_config_defaults():
     assert gate.command is None
     assert gate.commands is None
     assert gate.threshold is None
-    assert gate.depends_on == []
-    assert gate.omit_patterns == []
+    assert gate.depends_on == ()
+    assert gate.omit_patterns == ()
     assert gate.fail_message == ""
     assert gate.timeout_seconds == 300  # Default
 
@@ -407,8 +488,8 @@ def test_gate_config_with_all_fields():
 
     assert gate.name == "coverage"
     assert gate.threshold == 80
-    assert gate.depends_on == ["testing"]
-    assert gate.omit_patterns == ["playground/*"]
+    assert gate.depends_on == ("testing",)
+    assert gate.omit_patterns == ("playground/*",)
     assert gate.timeout_seconds == 60
 
 
@@ -453,8 +534,6 @@ def test_should_skip_gate_no_skip_patterns():
 
 def test_should_skip_gate_all_files_match(monkeypatch):
     """Gate should skip if all modified files match skip patterns."""
-    import quality_gates
-
     gate = GateConfig(
         name="coverage",
         enabled=True,
@@ -478,10 +557,32 @@ def test_should_skip_gate_all_files_match(monkeypatch):
     assert quality_gates._should_skip_gate(gate)
 
 
+def test_should_skip_gate_mid_string_glob(monkeypatch):
+    """Patterns with a wildcard mid-path (regex branch) decide the skip too."""
+    gate = GateConfig(
+        name="coverage",
+        enabled=True,
+        tool="diff-cover",
+        command="diff-cover coverage.xml",
+        required=True,
+        skip_if_only_paths=[".ai-sessions/**/*.md", "docs/**/*.md"],
+    )
+
+    def mock_get_modified_files():
+        return [".ai-sessions/2025-10-27/commit-123456.md", "docs/architecture/design.md"]
+
+    monkeypatch.setattr(quality_gates, "_get_modified_files", mock_get_modified_files)
+    assert quality_gates._should_skip_gate(gate)
+
+    def mock_get_modified_files_with_txt():
+        return ["docs/architecture/notes.txt"]
+
+    monkeypatch.setattr(quality_gates, "_get_modified_files", mock_get_modified_files_with_txt)
+    assert not quality_gates._should_skip_gate(gate)
+
+
 def test_should_skip_gate_mixed_files(monkeypatch):
     """Gate should NOT skip if some files don't match skip patterns."""
-    import quality_gates
-
     gate = GateConfig(
         name="coverage",
         enabled=True,
@@ -506,8 +607,6 @@ def test_should_skip_gate_mixed_files(monkeypatch):
 
 def test_should_skip_gate_config_file_not_skipped(monkeypatch):
     """Configuration files should NOT be skipped (not in skip patterns)."""
-    import quality_gates
-
     gate = GateConfig(
         name="coverage",
         enabled=True,
@@ -532,8 +631,6 @@ def test_should_skip_gate_config_file_not_skipped(monkeypatch):
 
 def test_should_skip_gate_no_files_modified(monkeypatch):
     """Gate should NOT skip if no files are modified."""
-    import quality_gates
-
     gate = GateConfig(
         name="coverage",
         enabled=True,
@@ -553,6 +650,29 @@ def test_should_skip_gate_no_files_modified(monkeypatch):
     assert not quality_gates._should_skip_gate(gate)
 
 
+def test_get_modified_files_runs_git_once_per_run(monkeypatch):
+    """Modified files are computed once and reused until the cache is reset."""
+    import subprocess
+
+    calls = []
+
+    def mock_run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout="docs/a.md\nREADME.md\n", stderr="")
+
+    monkeypatch.setattr(quality_gates.subprocess, "run", mock_run)
+    monkeypatch.setattr(quality_gates, "_MODIFIED_FILES_CACHE", None)
+
+    first = quality_gates._get_modified_files()
+    first.append("mutated.py")  # Callers get a copy, not the cache itself
+    assert quality_gates._get_modified_files() == ["docs/a.md", "README.md"]
+    assert len(calls) == 1
+
+    quality_gates._reset_modified_files_cache()
+    quality_gates._get_modified_files()
+    assert len(calls) == 2
+
+
 def test_parse_config_includes_skip_if_only_paths():
     """Parsed config should include skip_if_only_paths field."""
     config_dict = {
@@ -571,11 +691,11 @@ def test_parse_config_includes_skip_if_only_paths():
 
     parsed = _parse_config(config_dict)
 
-    assert parsed.gates["coverage"].skip_if_only_paths == [".ai-sessions/**", "docs/**"]
+    assert parsed.gates["coverage"].skip_if_only_paths == (".ai-sessions/**", "docs/**")
 
 
 def test_parse_config_defaults_empty_skip_if_only_paths():
-    """Parsed config should default skip_if_only_paths to empty list."""
+    """Parsed config should default skip_if_only_paths to empty tuple."""
     config_dict = {
         "version": "1.0.0",
         "gates": {
@@ -591,7 +711,7 @@ def test_parse_config_defaults_empty_skip_if_only_paths():
 
     parsed = _parse_config(config_dict)
 
-    assert parsed.gates["coverage"].skip_if_only_paths == []
+    assert parsed.gates["coverage"].skip_if_only_paths == ()
 
 
 if __name__ == "__main__":